@@ -14,22 +14,25 @@ request type.
 """
 from __future__ import annotations
 
-import sys
 import typing as t
 
-from functools import partial
+from collections import deque
+from functools import lru_cache
 from traceback import extract_tb
 
 from sanic.exceptions import BadRequest, SanicException
+from sanic.headers import Accept
 from sanic.helpers import STATUS_CODES
 from sanic.response import html, json, text
 
 
 dumps: t.Callable[..., str]
 try:
-    from ujson import dumps
+    from ujson import dumps as ujson_dumps
+
+    def dumps(obj: t.Any, **kwargs: t.Any) -> str:
+        return ujson_dumps(obj, escape_forward_slashes=False, **kwargs)
 
-    dumps = partial(dumps, escape_forward_slashes=False)
 except ImportError:  # noqa
     from json import dumps
 
@@ -42,6 +45,10 @@ FALLBACK_TEXT = (
     "cannot complete your request."
 )
 FALLBACK_STATUS = 500
+_STATUS_TEXT_DECODED = {
+    status: status_text.decode()
+    for status, status_text in STATUS_CODES.items()
+}
 
 
 class BaseRenderer:
@@ -76,7 +83,7 @@ class BaseRenderer:
 
     @property
     def title(self):
-        status_text = STATUS_CODES.get(self.status, b"Error Occurred").decode()
+        status_text = _STATUS_TEXT_DECODED.get(self.status, "Error Occurred")
         return f"{self.status} — {status_text}"
 
     def render(self) -> HTTPResponse:
@@ -193,15 +200,15 @@ class HTMLRenderer(BaseRenderer):
     def _generate_body(self, *, full):
         lines = []
         if full:
-            _, exc_value, __ = sys.exc_info()
-            exceptions = []
+            exc_value = self.exception
+            exceptions: t.Deque[str] = deque()
             while exc_value:
-                exceptions.append(self._format_exc(exc_value))
+                exceptions.appendleft(self._format_exc(exc_value))
                 exc_value = exc_value.__cause__
 
-            traceback_html = self.TRACEBACK_BORDER.join(reversed(exceptions))
-            appname = escape(self.request.app.name)
-            name = escape(self.exception.__class__.__name__)
+            traceback_html = self.TRACEBACK_BORDER.join(exceptions)
+            appname = _escape_cached(self.request.app.name)
+            name = _escape_cached(self.exception.__class__.__name__)
             value = escape(self.exception)
             path = escape(self.request.path)
             lines += [
@@ -234,12 +241,12 @@ class HTMLRenderer(BaseRenderer):
         )
 
     def _format_exc(self, exc):
-        frames = extract_tb(exc.__traceback__)
+        format_line = self.TRACEBACK_LINE_HTML.format
         frame_html = "".join(
-            self.TRACEBACK_LINE_HTML.format(frame) for frame in frames
+            [format_line(frame) for frame in extract_tb(exc.__traceback__)]
         )
         return self.TRACEBACK_WRAPPER_HTML.format(
-            exc_name=escape(exc.__class__.__name__),
+            exc_name=_escape_cached(exc.__class__.__name__),
             exc_value=escape(exc),
             frame_html=frame_html,
         )
@@ -283,8 +290,8 @@ class TextRenderer(BaseRenderer):
     def _generate_body(self, *, full):
         lines = []
         if full:
-            _, exc_value, __ = sys.exc_info()
-            exceptions = []
+            exc_value = self.exception
+            exceptions: t.Deque[str] = deque()
 
             lines += [
                 f"{self.exception.__class__.__name__}: {self.exception} while "
@@ -294,10 +301,10 @@ class TextRenderer(BaseRenderer):
             ]
 
             while exc_value:
-                exceptions.append(self._format_exc(exc_value))
+                exceptions.appendleft(self._format_exc(exc_value))
                 exc_value = exc_value.__cause__
 
-            lines += exceptions[::-1]
+            lines += exceptions
 
         for attr, display in (("context", True), ("extra", bool(full))):
             info = getattr(self.exception, attr, None)
@@ -351,7 +358,7 @@ class JSONRenderer(BaseRenderer):
                 output[attr] = info
 
         if full:
-            _, exc_value, __ = sys.exc_info()
+            exc_value = self.exception
             exceptions = []
 
             while exc_value:
@@ -380,7 +387,7 @@ class JSONRenderer(BaseRenderer):
 
     @property
     def title(self):
-        return STATUS_CODES.get(self.status, b"Error Occurred").decode()
+        return _STATUS_TEXT_DECODED.get(self.status, "Error Occurred")
 
 
 def escape(text):
@@ -390,6 +397,15 @@ def escape(text):
     return f"{text}".replace("&", "&amp;").replace("<", "&lt;")
 
 
+@lru_cache(maxsize=128)
+def _escape_cached(text: str) -> str:
+    """
+    Escape a value that repeats across requests, such as an app or
+    exception class name.
+    """
+    return escape(text)
+
+
 RENDERERS_BY_CONFIG = {
     "html": HTMLRenderer,
     "json": JSONRenderer,
@@ -405,6 +421,14 @@ RENDERERS_BY_CONTENT_TYPE = {
 CONTENT_TYPE_BY_RENDERERS = {
     v: k for k, v in RENDERERS_BY_CONTENT_TYPE.items()
 }
+# Parsed once so that matching against the Accept header does not build
+# new Accept objects on every error response
+_ACCEPT_BY_RENDERERS = {
+    renderer: Accept.parse(content_type)
+    for renderer, content_type in CONTENT_TYPE_BY_RENDERERS.items()
+}
+# Request bodies of these types are never sniffed for JSON
+NON_JSON_BODY_TYPES = {"multipart/form-data"}
 
 # Handler source code is checked for which response types it returns with the
 # route error_format="auto" (default) to determine which format to use.
@@ -471,7 +495,7 @@ def exception_response(
                 # https://developer.mozilla.org/en-US/docs/Web/HTTP/Content_negotiation/List_of_default_Accept_values
 
                 if acceptable and acceptable[0].match(
-                    "text/html",
+                    _ACCEPT_BY_RENDERERS[HTMLRenderer],
                     allow_type_wildcard=False,
                     allow_subtype_wildcard=False,
                 ):
@@ -483,7 +507,7 @@ def exception_response(
                 elif (
                     acceptable
                     and acceptable.match(
-                        "application/json",
+                        _ACCEPT_BY_RENDERERS[JSONRenderer],
                         allow_type_wildcard=False,
                         allow_subtype_wildcard=False,
                     )
@@ -495,8 +519,12 @@ def exception_response(
                 # The likely use case here is a raw socket.
                 elif not acceptable:
                     renderer = TextRenderer
+                # Fourth, skip decoding a body that cannot be JSON so that
+                # an error response never pays for a full parse of it
+                elif not request.body or content_type in NON_JSON_BODY_TYPES:
+                    renderer = base
                 else:
-                    # Fourth, look to see if there was a JSON body
+                    # Fifth, look to see if there was a JSON body
                     # When in this situation, the request is probably coming
                     # from curl, an API client like Postman or Insomnia, or a
                     # package like requests or httpx
@@ -511,9 +539,9 @@ def exception_response(
                 renderer = RENDERERS_BY_CONFIG.get(render_format, renderer)
 
             # Lastly, if there is an Accept header, make sure
-            # our choice is okay
-            if acceptable:
-                type_ = CONTENT_TYPE_BY_RENDERERS.get(renderer)  # type: ignore
+            # our choice is okay (anything is okay with */*)
+            if acceptable and not acceptable.has_wildcard:
+                type_ = _ACCEPT_BY_RENDERERS.get(renderer)  # type: ignore
                 if type_ and type_ not in acceptable:
                     # If the renderer selected is not in the Accept header
                     # look through what is in the Accept header, and select
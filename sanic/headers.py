@@ -2,7 +2,19 @@ from __future__ import annotations
 
 import re
 
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 from urllib.parse import unquote
 
 from sanic.exceptions import InvalidHeader
@@ -16,15 +28,21 @@ HeaderIterable = Iterable[Tuple[str, Any]]  # Values convertible to str
 HeaderBytesIterable = Iterable[Tuple[bytes, bytes]]
 Options = Dict[str, Union[int, str]]  # key=value fields in various headers
 OptionsIterable = Iterable[Tuple[str, str]]  # May contain duplicate keys
+ACCEPT_CACHE_SIZE = 1024
 
 _token, _quoted = r"([\w!#$%&'*+\-.^_`|~]+)", r'"([^"]*)"'
 _param = re.compile(rf";\s*{_token}=(?:{_token}|{_quoted})", re.ASCII)
+_param_finditer = _param.finditer
 _firefox_quote_escape = re.compile(r'\\"(?!; |\s*$)')
 _ipv6 = "(?:[0-9A-Fa-f]{0,4}:){2,7}[0-9A-Fa-f]{0,4}"
 _ipv6_re = re.compile(_ipv6)
 _host_re = re.compile(
     r"((?:\[" + _ipv6 + r"\])|[a-zA-Z0-9.\-]{1,253})(?::(\d{1,5}))?"
 )
+_accept_media = re.compile(
+    r"([^\s/;]+)\s*/\s*([^\s/;]+)\s*((?:;\s*[^\s=;]+\s*=[^;]*)*)", re.ASCII
+)
+_accept_param = re.compile(r";\s*([^\s=;]+)\s*=([^;]*)", re.ASCII)
 
 # RFC's quoted-pair escapes are mostly ignored by browsers. Chrome, Firefox and
 # curl all have different escaping, that we try to handle as well as possible,
@@ -33,16 +51,33 @@ _host_re = re.compile(
 # For more information, consult ../tests/test_requests.py
 
 
+class _ReadOnlySlots:
+    """Parsed Accept values are cached and shared between requests, so their
+    attributes may be set once but never reassigned."""
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if hasattr(self, name):
+            raise AttributeError(
+                f"{self.__class__.__name__}.{name} is read-only"
+            )
+        super().__setattr__(name, value)
+
+
 def parse_arg_as_accept(f):
     def func(self, other, *args, **kwargs):
-        if not isinstance(other, Accept) and other:
+        # An empty AcceptContainer has nothing to compare against
+        if self and not isinstance(other, Accept) and other:
             other = Accept.parse(other)
         return f(self, other, *args, **kwargs)
 
     return func
 
 
-class MediaType(str):
+class MediaType(_ReadOnlySlots, str):
+    __slots__ = ("value", "is_wildcard")
+
     def __new__(cls, value: str):
         return str.__new__(cls, value)
 
@@ -74,7 +109,9 @@ class MediaType(str):
         return value == "*"
 
 
-class Accept(str):
+class Accept(_ReadOnlySlots, str):
+    __slots__ = ("value", "type_", "subtype", "qvalue", "params")
+
     def __new__(cls, value: str, *args, **kwargs):
         return str.__new__(cls, value)
 
@@ -96,7 +133,7 @@ class Accept(str):
         self.type_ = type_
         self.subtype = subtype
         self.qvalue = qvalue
-        self.params = kwargs
+        self.params: Mapping[str, str] = MappingProxyType(kwargs)
 
     def _compare(self, other, method):
         try:
@@ -159,32 +196,34 @@ class Accept(str):
 
     @classmethod
     def parse(cls, raw: str) -> Accept:
-        invalid = False
         mtype = raw.strip()
+        match = _accept_media.fullmatch(mtype)
 
-        try:
-            media, *raw_params = mtype.split(";")
-            type_, subtype = media.split("/")
-        except ValueError:
-            invalid = True
-
-        if invalid or not type_ or not subtype:
+        if not match:
             raise InvalidHeader(f"Header contains invalid Accept value: {raw}")
 
-        params = dict(
-            [
-                (key.strip(), value.strip())
-                for key, value in (param.split("=", 1) for param in raw_params)
-            ]
-        )
+        type_, subtype, raw_params = match.groups()
+        params = {
+            key: value.strip()
+            for key, value in _accept_param.findall(raw_params)
+        }
 
         return cls(mtype, MediaType(type_), MediaType(subtype), **params)
 
 
 class AcceptContainer(list):
+    # Set by parse_accept when a */* entry makes any media type acceptable
+    has_wildcard = False
+
+    # Parse the candidate once here rather than once per item in Accept.match
+    @parse_arg_as_accept
     def __contains__(self, o: object) -> bool:
-        return any(item.match(o) for item in self)
+        for item in self:
+            if item.match(o):
+                return True
+        return False
 
+    @parse_arg_as_accept
     def match(
         self,
         o: object,
@@ -192,14 +231,14 @@ class AcceptContainer(list):
         allow_type_wildcard: bool = True,
         allow_subtype_wildcard: bool = True,
     ) -> bool:
-        return any(
-            item.match(
+        for item in self:
+            if item.match(
                 o,
                 allow_type_wildcard=allow_type_wildcard,
                 allow_subtype_wildcard=allow_subtype_wildcard,
-            )
-            for item in self
-        )
+            ):
+                return True
+        return False
 
 
 def parse_content_header(value: str) -> Tuple[str, Options]:
@@ -213,13 +252,13 @@ def parse_content_header(value: str) -> Tuple[str, Options]:
     """
     value = _firefox_quote_escape.sub("%22", value)
     pos = value.find(";")
-    if pos == -1:
-        options: Dict[str, Union[int, str]] = {}
-    else:
-        options = {
-            m.group(1).lower(): m.group(2) or m.group(3).replace("%22", '"')
-            for m in _param.finditer(value[pos:])
-        }
+    options: Dict[str, Union[int, str]] = {}
+    if pos != -1:
+        for m in _param_finditer(value[pos:]):
+            key, token, quoted = m.groups()
+            options[key.lower()] = (
+                token if token is not None else quoted.replace("%22", '"')
+            )
         value = value[:pos]
     return value.strip().lower(), options
 
@@ -244,7 +283,10 @@ def parse_forwarded(headers, config) -> Optional[Options]:
     header = ",".join(header)  # Join multiple header lines
     if secret not in header:
         return None
-    # Loop over <separator><key>=<value> elements from right to left
+    # Loop over <separator><key>=<value> elements from right to left. Keys
+    # and values are kept reversed until we know the element is the one
+    # we want, so discarded elements never get flipped back.
+    rsecret = secret[::-1]
     sep = pos = None
     options: List[Tuple[str, str]] = []
     found = False
@@ -258,16 +300,20 @@ def parse_forwarded(headers, config) -> Optional[Options]:
             del options[:]
         pos = m.end()
         val_token, val_quoted, key, sep = m.groups()
-        key = key.lower()[::-1]
-        val = (val_token or val_quoted.replace('"\\', '"'))[::-1]
+        key = key.lower()
+        val = val_token or val_quoted.replace('"\\', '"')
         options.append((key, val))
-        if key in ("secret", "by") and val == secret:
+        if key in ("terces", "yb") and val == rsecret:
             found = True
         # Check if we would return on next round, to avoid useless parse
         if found and sep != ";":
             break
-    # If secret was found, return the matching options in left-to-right order
-    return fwd_normalize(reversed(options)) if found else None
+    if not found:
+        return None
+    # Return the matching options in left-to-right order
+    return fwd_normalize(
+        (key[::-1], val[::-1]) for key, val in reversed(options)
+    )
 
 
 def parse_xforwarded(headers, config) -> Optional[Options]:
@@ -344,6 +390,18 @@ def parse_host(host: str) -> Tuple[Optional[str], Optional[int]]:
     """Split host:port into hostname and port.
     :return: None in place of missing elements
     """
+    # Fast path for the common name[:port] form; anything else (IPv6
+    # literals, invalid input) is left to the full regex.
+    name, colon, port = host.partition(":")
+    if (
+        0 < len(name) <= 253
+        and name.isascii()
+        and name.replace(".", "a").replace("-", "a").isalnum()
+        and (
+            not colon or (port.isascii() and port.isdigit() and len(port) <= 5)
+        )
+    ):
+        return name.lower(), int(port) if colon else None
     m = _host_re.fullmatch(host)
     if not m:
         return None, None
@@ -351,17 +409,21 @@ def parse_host(host: str) -> Tuple[Optional[str], Optional[int]]:
     return host.lower(), int(port) if port is not None else None
 
 
-_HTTP1_STATUSLINES = [
+# Only 1xx-5xx are defined status classes; others are formatted on demand
+_HTTP1_STATUSLINES = tuple(
     b"HTTP/1.1 %d %b\r\n" % (status, STATUS_CODES.get(status, b"UNKNOWN"))
-    for status in range(1000)
-]
+    for status in range(600)
+)
 
 
 def format_http1_response(status: int, headers: HeaderBytesIterable) -> bytes:
     """Format a HTTP/1.1 response header."""
     # Note: benchmarks show that here bytes concat is faster than bytearray,
     # b"".join() or %-formatting. %timeit any changes you make.
-    ret = _HTTP1_STATUSLINES[status]
+    try:
+        ret = _HTTP1_STATUSLINES[status]
+    except IndexError:
+        ret = b"HTTP/1.1 %d UNKNOWN\r\n" % status
     for h in headers:
         ret += b"%b: %b\r\n" % h
     ret += b"\r\n"
@@ -377,23 +439,36 @@ def _sort_accept_value(accept: Accept):
     )
 
 
-def parse_accept(accept: str) -> AcceptContainer:
-    """Parse an Accept header and order the acceptable media types in
-    accorsing to RFC 7231, s. 5.3.2
-    https://datatracker.ietf.org/doc/html/rfc7231#section-5.3.2
-    """
+@lru_cache(maxsize=ACCEPT_CACHE_SIZE)
+def _parse_accept_cached(accept: str) -> Tuple[Tuple[Accept, ...], bool]:
     media_types = accept.split(",")
     accept_list: List[Accept] = []
+    has_wildcard = False
 
     for mtype in media_types:
         if not mtype:
             continue
 
-        accept_list.append(Accept.parse(mtype))
+        item = Accept.parse(mtype)
+        if item.type_.is_wildcard and item.subtype.is_wildcard:
+            has_wildcard = True
+        accept_list.append(item)
 
-    return AcceptContainer(
-        sorted(accept_list, key=_sort_accept_value, reverse=True)
-    )
+    ordered = tuple(sorted(accept_list, key=_sort_accept_value, reverse=True))
+    return ordered, has_wildcard
+
+
+def parse_accept(accept: str) -> AcceptContainer:
+    """Parse an Accept header and order the acceptable media types in
+    accorsing to RFC 7231, s. 5.3.2
+    https://datatracker.ietf.org/doc/html/rfc7231#section-5.3.2
+    """
+    # Clients send only a handful of distinct Accept headers, so the parsed
+    # media types are cached and shared; each caller gets its own container.
+    accept_list, has_wildcard = _parse_accept_cached(accept)
+    container = AcceptContainer(accept_list)
+    container.has_wildcard = has_wildcard
+    return container
 
 
 def parse_credentials(
@@ -404,7 +479,8 @@ def parse_credentials(
     if not prefixes or not isinstance(prefixes, (list, tuple, set)):
         prefixes = ("Basic", "Bearer", "Token")
     if header is not None:
-        for prefix in prefixes:
-            if prefix in header:
-                return prefix, header.partition(prefix)[-1].strip()
+        # The auth scheme must lead the header, separated by whitespace
+        parts = header.split(None, 1)
+        if parts and parts[0] in prefixes:
+            return parts[0], parts[1].strip() if len(parts) > 1 else ""
     return None, header
@@ -2,7 +2,7 @@ import pytest
 
 from sanic import Sanic
 from sanic.config import Config
-from sanic.errorpages import HTMLRenderer, exception_response
+from sanic.errorpages import HTMLRenderer, escape, exception_response
 from sanic.exceptions import NotFound, SanicException
 from sanic.handlers import ErrorHandler
 from sanic.request import Request
@@ -376,3 +376,73 @@ def test_config_fallback_bad_value(app):
     message = "Unknown format: fake"
     with pytest.raises(SanicException, match=message):
         app.config.FALLBACK_ERROR_FORMAT = "fake"
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    (
+        ("plain", "plain"),
+        ("<b>&amp;</b>", "&lt;b>&amp;amp;&lt;/b>"),
+        ("\"quoted\" > 'single'", "\"quoted\" > 'single'"),
+        (ValueError("<oops>"), "&lt;oops>"),
+    ),
+)
+def test_escape(value, expected):
+    assert escape(value) == expected
+
+
+@pytest.mark.parametrize(
+    "body,content_type,expected",
+    (
+        (b"", None, "text/html; charset=utf-8"),
+        (b'{"foo": "bar"}', None, "application/json"),
+        (
+            b'{"foo": "bar"}',
+            "application/x-www-form-urlencoded",
+            "application/json",
+        ),
+        (b'{"foo": "bar"}', "multipart/form-data", "text/html; charset=utf-8"),
+        (
+            b"foo=bar",
+            "application/x-www-form-urlencoded",
+            "text/html; charset=utf-8",
+        ),
+    ),
+)
+def test_auto_fallback_json_body_sniffing(
+    fake_request, body, content_type, expected
+):
+    fake_request.body = body
+    if content_type:
+        fake_request.headers["content-type"] = content_type
+
+    try:
+        raise Exception("bad stuff")
+    except Exception as e:
+        response = exception_response(
+            fake_request,
+            e,
+            True,
+            base=HTMLRenderer,
+            fallback="auto",
+        )
+
+    assert response.content_type == expected
+    if not body or content_type == "multipart/form-data":
+        assert fake_request.parsed_json is None
+
+
+def test_full_render_outside_except_block(fake_request):
+    try:
+        try:
+            raise ValueError("root cause")
+        except ValueError as e:
+            raise SanicException("wrapper") from e
+    except SanicException as e:
+        exception = e
+
+    response = HTMLRenderer(fake_request, exception, True).render()
+    body = response.body.decode()
+    assert "ValueError: root cause" in body
+    assert "The above exception was the direct cause" in body
+    assert body.index("ValueError") < body.index("SanicException: wrapper")
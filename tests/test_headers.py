@@ -1,3 +1,4 @@
+from time import perf_counter
 from unittest.mock import Mock
 
 import pytest
@@ -217,6 +218,8 @@ def test_parse_accept_ordered_okay(raw):
         "missing",
         "missing/",
         "/missing",
+        "too/many/parts",
+        "show/first; q",
     ),
 )
 def test_bad_accept(raw):
@@ -228,6 +231,50 @@ def test_empty_accept():
     assert headers.parse_accept("") == []
 
 
+def test_empty_accept_does_not_parse_candidate():
+    acceptable = headers.parse_accept("")
+    assert "bogus" not in acceptable
+    assert not acceptable.match("bogus")
+
+
+def test_parse_accept_cached():
+    first = headers.parse_accept("text/html, */*; q=0.8")
+    second = headers.parse_accept("text/html, */*; q=0.8")
+    assert first == second
+    assert first is not second
+    assert all(a is b for a, b in zip(first, second))
+
+    first.append(headers.Accept.parse("foo/bar"))
+    assert len(headers.parse_accept("text/html, */*; q=0.8")) == 2
+
+    with pytest.raises(TypeError):
+        first[0].params["level"] = "1"
+    with pytest.raises(AttributeError):
+        first[0].qvalue = 0.1
+    with pytest.raises(AttributeError):
+        first[0].type_.is_wildcard = True
+    third = headers.parse_accept("text/html, */*; q=0.8")
+    assert third[0].params == {}
+    assert third[0].qvalue == 1.0
+    assert not third[0].type_.is_wildcard
+
+
+def test_accept_whitespace_around_slash():
+    accept = headers.Accept.parse("text / html; q=0.5")
+    assert accept.type_ == "text"
+    assert accept.subtype == "html"
+    assert accept.qvalue == 0.5
+
+
+def test_accept_invalid_params_fail_fast():
+    # Ambiguous whitespace in the params grammar once made a failing match
+    # backtrack exponentially in the number of segments
+    start = perf_counter()
+    with pytest.raises(InvalidHeader):
+        headers.Accept.parse("a/b" + "; k= " * 10_000 + ";")
+    assert perf_counter() - start < 1
+
+
 def test_wildcard_accept_set_ok():
     accept = headers.parse_accept("*/*")[0]
     assert accept.type_.is_wildcard
@@ -368,3 +415,77 @@ def test_value_not_in_accept(value):
 def test_browser_headers(header, expected):
     request = Request(b"/", {"accept": header}, "1.1", "GET", None, None)
     assert request.accept == expected
+
+
+@pytest.mark.parametrize(
+    "status,headers_,expected",
+    (
+        (200, [], b"HTTP/1.1 200 OK\r\n\r\n"),
+        (
+            404,
+            [(b"content-length", b"0")],
+            b"HTTP/1.1 404 Not Found\r\ncontent-length: 0\r\n\r\n",
+        ),
+        (599, [], b"HTTP/1.1 599 UNKNOWN\r\n\r\n"),
+        (999, [], b"HTTP/1.1 999 UNKNOWN\r\n\r\n"),
+        (
+            200,
+            ((k, v) for k, v in ((b"a", b"1"), (b"b", b"2"))),
+            b"HTTP/1.1 200 OK\r\na: 1\r\nb: 2\r\n\r\n",
+        ),
+    ),
+)
+def test_format_http1_response(status, headers_, expected):
+    assert headers.format_http1_response(status, headers_) == expected
+
+
+@pytest.mark.parametrize(
+    "header,prefixes,expected",
+    (
+        (None, None, (None, None)),
+        ("Bearer abc", None, ("Bearer", "abc")),
+        ("  Token   abc ", None, ("Token", "abc")),
+        ("Bearer\tabc", None, ("Bearer", "abc")),
+        ("", None, (None, "")),
+        ("Basic", None, ("Basic", "")),
+        ("XBearer abc", None, (None, "XBearer abc")),
+        ("Bearerabc", None, (None, "Bearerabc")),
+        ("Basic abc", ("Bearer", "Token"), (None, "Basic abc")),
+        ("Custom abc", {"Custom"}, ("Custom", "abc")),
+    ),
+)
+def test_parse_credentials(header, prefixes, expected):
+    assert headers.parse_credentials(header, prefixes) == expected
+
+
+@pytest.mark.parametrize(
+    "host,expected",
+    (
+        ("localhost", ("localhost", None)),
+        ("Example.COM:8000", ("example.com", 8000)),
+        ("[::1]", ("[::1]", None)),
+        ("[::1]:80", ("[::1]", 80)),
+        ("example.com:", (None, None)),
+        ("example.com:123456", (None, None)),
+        ("example.com:1:2", (None, None)),
+        (":80", (None, None)),
+        ("exa mple.com", (None, None)),
+        ("", (None, None)),
+    ),
+)
+def test_parse_host(host, expected):
+    assert headers.parse_host(host) == expected
+
+
+@pytest.mark.parametrize(
+    "raw,expected",
+    (
+        ("", False),
+        ("*/*", True),
+        ("text/html, */*; q=0.8", True),
+        ("text/*", False),
+        ("text/html, application/json", False),
+    ),
+)
+def test_accept_has_wildcard(raw, expected):
+    assert headers.parse_accept(raw).has_wildcard is expected